@@ -44,12 +44,14 @@ def prepare_target_directory(run_data: RunData) -> None:
     else:
         # Clean directory if it exists
         logger.print_action_start(f"Cleaning target directory '{run_data.target_dir}'")
-        for item in os.listdir(run_data.target_dir):
-            item_path = os.path.join(run_data.target_dir, item)
-            if os.path.isdir(item_path):
-                shutil.rmtree(item_path)
+        # Directory entries carry their file type, no extra stat call is needed
+        with os.scandir(run_data.target_dir) as entries:
+            items = list(entries)
+        for item in items:
+            if item.is_dir():
+                shutil.rmtree(item.path)
             else:
-                os.remove(item_path)
+                os.remove(item.path)
 
     logger.print_action_end()
 
@@ -118,29 +120,18 @@ def evaluate_midi_mapping(run_data: RunData) -> None:
 
     instruments_count = len(audio_files)
     note_range = max_note - min_note + 1
+    left_count = instruments_count // 2
+    # Special case: the instruments fill the whole MIDI note range
+    fills_range = instruments_count == note_range and instruments_count > 0
 
-    midi_mapping = {}
-    if instruments_count == note_range and instruments_count > 0:
-        # Cas spécial : chaque instrument couvre toute la plage
-        for i, filename in enumerate(audio_files):
-            instrument_name = utils.get_instrument_name(filename)
-            midi_mapping[instrument_name] = min_note + i
-            run_data.midi_mapping[instrument_name] = min_note + i
-            logger.log("DEBUG", f"Mapping {instrument_name} to MIDI note {min_note + i}")
-    else:
-        left_count = instruments_count // 2
-        for i, filename in enumerate(audio_files):
-            instrument_name = utils.get_instrument_name(filename)
-            # Algo médian classique
-            if i < left_count:
-                offset = left_count - i
-                note = median_note - offset
-            else:
-                offset = i - left_count
-                note = median_note + offset
-            note = max(min_note, min(note, max_note))
-            run_data.midi_mapping[instrument_name] = note
-            logger.log("DEBUG", f"Mapping {instrument_name} to MIDI note {note}")
+    # Audio sources are already keyed by instrument name
+    for i, instrument_name in enumerate(audio_files):
+        if fills_range:
+            note = min_note + i
+        else:
+            note = utils.calculate_midi_note(i, left_count, median_note, min_note, max_note)
+        run_data.midi_mapping[instrument_name] = note
+        logger.log("DEBUG", f"Mapping {instrument_name} to MIDI note {note}")
 
 
 def print_midi_mapping(run_data: RunData) -> None:
@@ -182,34 +173,33 @@ def print_summary(run_data: RunData) -> None:
         msg = "Processing complete."
     else:
         msg = f"Processing complete in {run_data.generation_time:.2f} seconds."
-    logger.info(msg, write_log=False)
-    logger.info(f"DrumGizmo kit successfully created in {target_dir}", write_log=False)
-    logger.info("\nMain files:", write_log=False)
-    logger.info(f"  - {os.path.join(target_dir, 'drumkit.xml')}", write_log=False)
-    logger.info(f"  - {os.path.join(target_dir, 'midimap.xml')}", write_log=False)
-
-    logger.info("\nKit metadata summary:", write_log=False)
-    logger.info(f"  - Name: {metadata.get('name', '')}", write_log=False)
-    logger.info(f"  - Version: {metadata.get('version', '')}", write_log=False)
-    logger.info(f"  - Description: {metadata.get('description', '')}", write_log=False)
-    logger.info(f"  - Notes: {metadata.get('notes', '')}", write_log=False)
-    logger.info(f"  - Author: {metadata.get('author', '')}", write_log=False)
-    logger.info(f"  - License: {metadata.get('license', '')}", write_log=False)
-    logger.info(f"  - Sample rate: {metadata.get('samplerate', '')} Hz", write_log=False)
-    logger.info(f"  - Website: {metadata.get('website', '')}", write_log=False)
-    logger.info(f"  - Logo: {metadata.get('logo', '')}", write_log=False)
-
-    logger.info(f"\nNumber of instruments created: {len(processed_audio_files)}", write_log=False)
-    logger.info("\nInstrument samples MIDI mapping:", write_log=False)
+
+    # Build the whole summary and print it at once
+    lines = [
+        msg,
+        f"DrumGizmo kit successfully created in {target_dir}",
+        "\nMain files:",
+        f"  - {os.path.join(target_dir, 'drumkit.xml')}",
+        f"  - {os.path.join(target_dir, 'midimap.xml')}",
+        "\nKit metadata summary:",
+        f"  - Name: {metadata.get('name', '')}",
+        f"  - Version: {metadata.get('version', '')}",
+        f"  - Description: {metadata.get('description', '')}",
+        f"  - Notes: {metadata.get('notes', '')}",
+        f"  - Author: {metadata.get('author', '')}",
+        f"  - License: {metadata.get('license', '')}",
+        f"  - Sample rate: {metadata.get('samplerate', '')} Hz",
+        f"  - Website: {metadata.get('website', '')}",
+        f"  - Logo: {metadata.get('logo', '')}",
+        f"\nNumber of instruments created: {len(processed_audio_files)}",
+        "\nInstrument samples MIDI mapping:",
+    ]
 
     # Display mapping with MIDI notes
     for instrument in processed_audio_files:
         midi_note = midi_mapping.get(instrument, "N/A")
         original_file = audio_files.get(instrument, {}).get("source_path", "N/A")
-        logger.info(
-            f"  - MIDI note {midi_note}: {instrument}: {os.path.basename(original_file)}",
-            write_log=False,
-        )
+        lines.append(f"  - MIDI note {midi_note}: {instrument}: {os.path.basename(original_file)}")
 
     extra_files = []
     if metadata.get("logo"):
@@ -218,9 +208,11 @@ def print_summary(run_data: RunData) -> None:
         extra_files.extend(metadata["extra_files"])
 
     if extra_files:
-        logger.info("\nExtra files copied:", write_log=False)
+        lines.append("\nExtra files copied:")
         for extra_file in extra_files:
-            logger.info(f"  - {extra_file}", write_log=False)
+            lines.append(f"  - {extra_file}")
+
+    logger.info("\n".join(lines), write_log=False)
 
 
 def process_audio_files(run_data: RunData) -> Dict[str, List[str]]:
@@ -373,10 +365,11 @@ def scan_source_files(run_data: RunData) -> None:
     )
 
     audio_files = {}
+    allowed_extensions = {ext.lower() for ext in extensions}
     for root, _, files in os.walk(source_dir):
         for file in files:
             file_ext = os.path.splitext(file)[1].lower().lstrip(".")
-            if file_ext in [ext.lower() for ext in extensions]:
+            if file_ext in allowed_extensions:
                 logger.debug(f"Found '{file}'")
                 file_path = os.path.join(root, file)
                 instrument_name = utils.get_instrument_name(file)
@@ -20,6 +20,9 @@ from typing import Any, List
 from drumgizmo_kits_generator import constants
 from drumgizmo_kits_generator.exceptions import AudioProcessingError, DependencyError
 
+# Velocity prefixes of the generated sample file names (e.g. '1-')
+VELOCITY_PREFIXES = tuple(f"{i}-" for i in range(1, 10))
+
 
 def check_dependency(command: str, error_message: str = None) -> str:
     """
@@ -55,9 +58,8 @@ def strip_quotes(value: str) -> str:
     if not isinstance(value, str):
         return value
 
-    if (value.startswith('"') and value.endswith('"')) or (
-        value.startswith("'") and value.endswith("'")
-    ):
+    # Same opening and closing quote character (slices are safe on empty strings)
+    if value[:1] in ('"', "'") and value[-1:] == value[:1]:
         return value[1:-1]
     return value
 
@@ -139,7 +141,7 @@ def get_instrument_name(file_name: str) -> str:
     # Remove extension if present
     file_base, _ = os.path.splitext(base)
     # Remove velocity prefix (e.g., '1-')
-    if file_base.startswith(tuple(f"{i}-" for i in range(1, 10))):
+    if file_base.startswith(VELOCITY_PREFIXES):
         parts = file_base.split("-", 1)
         if len(parts) > 1:
             instrument_name = parts[1]
@@ -10,14 +10,31 @@ XML generation utilities for DrumGizmo kits.
 """
 
 import datetime
+import functools
 import os
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from drumgizmo_kits_generator import constants, logger
 
 
+def _write_pretty_xml(root: ET.Element, xml_path: str) -> None:
+    """
+    Pretty print an XML tree and write it to a file.
+    The whole document is rendered in memory first and written with a single call.
+
+    Args:
+        root: The root XML element
+        xml_path: Path to the XML file to write
+    """
+    xml_string = ET.tostring(root, encoding="utf-8")
+    pretty_xml = xml.dom.minidom.parseString(xml_string).toprettyxml(indent="  ")
+
+    with open(xml_path, "w", encoding="utf-8") as f:
+        f.write(pretty_xml)
+
+
 def _add_metadata_elements(metadata_elem: ET.Element, metadata: Dict[str, Any]) -> None:
     """
     Add metadata elements to the metadata element of a drumkit XML.
@@ -25,6 +42,9 @@ def _add_metadata_elements(metadata_elem: ET.Element, metadata: Dict[str, Any])
         metadata_elem: The metadata XML element
         metadata: Metadata dictionary
     """
+    # Use the same timestamp for all generated dates
+    now = datetime.datetime.now()
+
     # Add title (same as name)
     title_elem = ET.SubElement(metadata_elem, "title")
     title_elem.text = metadata["name"]
@@ -43,7 +63,7 @@ def _add_metadata_elements(metadata_elem: ET.Element, metadata: Dict[str, Any])
     if metadata.get("notes"):
         notes_text = metadata["notes"]
     else:
-        current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        current_time = now.strftime("%Y-%m-%d %H:%M")
         notes_text = (
             f"DrumGizmo kit generated with drumgizmo-kits-generator - Generated at {current_time}"
         )
@@ -74,7 +94,7 @@ def _add_metadata_elements(metadata_elem: ET.Element, metadata: Dict[str, Any])
 
     # Add created timestamp
     created_elem = ET.SubElement(metadata_elem, "created")
-    current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = now.strftime("%Y-%m-%d %H:%M:%S")
     created_elem.text = (
         f"Generated on {current_time} with {constants.APP_NAME} "
         f"v{constants.APP_VERSION} ({constants.APP_LINK})"
@@ -114,6 +134,17 @@ def generate_drumkit_xml(
     # Add instruments section
     instruments_elem = ET.SubElement(root, "instruments")
 
+    # Prepare channel mappings, the same for each instrument
+    main_channels = set(metadata["main_channels"])
+    channelmaps = []
+    for channel in metadata["channels"]:
+        channelmap = {"in": channel, "out": channel}
+
+        # Mark main channels
+        if channel in main_channels:
+            channelmap["main"] = "true"
+        channelmaps.append(channelmap)
+
     # Add each instrument
     for instrument_name in instrument_names:
         instrument_elem = ET.SubElement(instruments_elem, "instrument")
@@ -121,21 +152,29 @@ def generate_drumkit_xml(
         instrument_elem.set("file", f"{instrument_name}/{instrument_name}.xml")
 
         # Add channel mappings
-        for channel in metadata["channels"]:
-            channelmap_elem = ET.SubElement(instrument_elem, "channelmap")
-            channelmap_elem.set("in", channel)
-            channelmap_elem.set("out", channel)
+        for channelmap in channelmaps:
+            ET.SubElement(instrument_elem, "channelmap", channelmap)
 
-            # Mark main channels
-            if channel in metadata["main_channels"]:
-                channelmap_elem.set("main", "true")
+    # Pretty print and write the XML
+    _write_pretty_xml(root, xml_path)
 
-    # Pretty print the XML
-    xml_string = ET.tostring(root, encoding="utf-8")
-    pretty_xml = xml.dom.minidom.parseString(xml_string).toprettyxml(indent="  ")
 
-    with open(xml_path, "w", encoding="utf-8") as f:
-        f.write(pretty_xml)
+@functools.lru_cache(maxsize=None)
+def _get_samples_powers(velocity_levels: int) -> Tuple[str, ...]:
+    """
+    Get the formatted power values of the samples, shared by all instruments of a kit.
+
+    Args:
+        velocity_levels: Number of velocity levels
+
+    Returns:
+        Tuple[str, ...]: Power values from the first to the last velocity level
+    """
+    # Calculate power based on velocity level using cartesian division
+    # First sample (i=1) gets power=1.0, then decreases
+    return tuple(
+        f"{(velocity_levels - i + 1) / velocity_levels:.6f}" for i in range(1, velocity_levels + 1)
+    )
 
 
 def _add_instrument_samples(
@@ -158,25 +197,25 @@ def _add_instrument_samples(
     # Get velocity levels
     velocity_levels = metadata.get("velocity_levels", constants.DEFAULT_VELOCITY_LEVELS)
 
+    # Map each kit channel to its filechannel index based on position in
+    # instrument_channels (starting from 1), the same for all velocity levels
+    channels_mapping = [
+        (channel, str((j % instrument_channels) + 1))
+        for j, channel in enumerate(metadata["channels"])
+    ]
+
     # Add a sample for each velocity level
-    for i in range(1, velocity_levels + 1):
+    for i, power in enumerate(_get_samples_powers(velocity_levels), 1):
         sample_elem = ET.SubElement(samples_elem, "sample")
         sample_elem.set("name", f"{instrument_name}-{i}")
-
-        # Calculate power based on velocity level using cartesian division
-        # First sample (i=1) gets power=1.0, then decreases
-        power = (velocity_levels - i + 1) / velocity_levels
-
-        sample_elem.set("power", f"{power:.6f}")
+        sample_elem.set("power", power)
 
         # Add audiofile elements for each channel
-        for j, channel in enumerate(metadata["channels"]):
+        sample_file = f"samples/{i}-{instrument_name}{original_ext}"
+        for channel, filechannel in channels_mapping:
             audiofile_elem = ET.SubElement(sample_elem, "audiofile")
             audiofile_elem.set("channel", channel)
-            audiofile_elem.set("file", f"samples/{i}-{instrument_name}{original_ext}")
-
-            # Set filechannel index based on position in instrument_channels (starting from 1)
-            filechannel = str((j % instrument_channels) + 1)
+            audiofile_elem.set("file", sample_file)
             audiofile_elem.set("filechannel", filechannel)
 
 
@@ -236,24 +275,17 @@ def generate_instrument_xml(
         samples_elem, metadata, instrument_name, original_ext, instrument_channels
     )
 
-    # Pretty print the XML
-    xml_string = ET.tostring(root, encoding="utf-8")
-    pretty_xml = xml.dom.minidom.parseString(xml_string).toprettyxml(indent="  ")
-
-    with open(xml_path, "w", encoding="utf-8") as f:
-        f.write(pretty_xml)
+    # Pretty print and write the XML
+    _write_pretty_xml(root, xml_path)
 
 
-def _add_midimap_elements(root: ET.Element, midi_mapping: Dict[str, int]) -> Dict[str, int]:
+def _add_midimap_elements(root: ET.Element, midi_mapping: Dict[str, int]) -> None:
     """
     Add mapping elements to the midimap XML.
 
     Args:
         root: The root XML element
-        instruments: List of instrument names
-        midi_params: Dictionary with MIDI parameters (min, max, median)
-    Returns:
-        A dictionary with the MIDI mapping
+        midi_mapping: MIDI mapping like `instrument_name: midi_note`
     """
     # Generate notes for each instrument
     for instrument_name, note in midi_mapping.items():
@@ -264,11 +296,6 @@ def _add_midimap_elements(root: ET.Element, midi_mapping: Dict[str, int]) -> Dic
         map_elem.set("velmin", "0")
         map_elem.set("velmax", "127")
 
-        # Store MIDI mapping
-        midi_mapping[instrument_name] = note
-
-    return midi_mapping
-
 
 def generate_midimap_xml(target_dir: str, midi_mapping: Dict[str, int]) -> None:
     """
@@ -291,14 +318,11 @@ def generate_midimap_xml(target_dir: str, midi_mapping: Dict[str, int]) -> None:
     # Add mapping elements
     _add_midimap_elements(root, midi_mapping)
 
-    # Pretty print the XML
-    xml_string = ET.tostring(root, encoding="utf-8")
-    pretty_xml = xml.dom.minidom.parseString(xml_string).toprettyxml(indent="  ")
-
-    with open(xml_path, "w", encoding="utf-8") as f:
-        f.write(pretty_xml)
+    # Pretty print and write the XML
+    _write_pretty_xml(root, xml_path)
 
-    # Display MIDI mapping
-    logger.debug("MIDI mapping (alphabetical order):", write_log=False)
-    for instrument, note in sorted(midi_mapping.items(), key=lambda x: x[0]):
-        logger.debug(f"  MIDI Note {note}: {instrument}", write_log=False)
+    # Display MIDI mapping (console only, skip sorting and formatting when not verbose)
+    if logger.is_verbose():
+        logger.debug("MIDI mapping (alphabetical order):", write_log=False)
+        for instrument, note in sorted(midi_mapping.items()):
+            logger.debug(f"  MIDI Note {note}: {instrument}", write_log=False)